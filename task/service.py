@@ -1,4 +1,50 @@
-from .types import Task, TaskPriority, TaskStatus
+import itertools
+from operator import attrgetter
+from typing import Any, Iterator
+
+from .types import PRIORITY_BY_VALUE, Task, TaskPriority, TaskStatus
+
+_TASK_FIELDS = frozenset(Task.model_fields)
+_INDEX_KEY = attrgetter("index")
+
+
+def _resolve_updates(updates: dict[str, Any]) -> dict[str, Any]:
+    """
+    Validates Task property updates and converts priority strings to TaskPriority.
+
+    Raises:
+        AttributeError: If a property does not exist on the Task object.
+        ValueError: If the task ID is being updated, a priority string is not a
+                    valid TaskPriority value, or an index is not an integer.
+    """
+    resolved = {}
+    for key, value in updates.items():
+        if key not in _TASK_FIELDS:
+            raise AttributeError(f"Task object has no attribute '{key}' to update.")
+        # Tasks are keyed by ID, so renaming one in place would desync the collection
+        if key == "id":
+            raise ValueError("Task ID cannot be updated.")
+        # Indices key the index lookup and get sorted, so only real ints are allowed
+        if key == "index" and (not isinstance(value, int) or isinstance(value, bool)):
+            raise ValueError(f"Invalid index '{value}'. Index must be an integer.")
+        # Convert priority string to enum if needed
+        if key == "priority" and isinstance(value, str):
+            priority = PRIORITY_BY_VALUE.get(value)
+            if priority is None:
+                raise ValueError(f"Invalid priority '{value}'.")
+            value = priority
+        resolved[key] = value
+    return resolved
+
+
+def _first_duplicate(values: list[Any]) -> Any:
+    """Returns the first value that appears more than once in `values`, or None."""
+    seen = set()
+    for value in values:
+        if value in seen:
+            return value
+        seen.add(value)
+    return None
 
 
 class TaskService:
@@ -11,10 +57,16 @@ class TaskService:
     prioritizing, and reordering.
     """
 
-    def __init__(self):
+    __slots__ = ("tasks", "_by_index", "_id_counter", "_max_index", "_sorted_cache", "_list_cache")
+
+    def __init__(self) -> None:
         """Initializes the TaskService with an empty task collection and a counter for generating unique task IDs."""
         self.tasks: dict[str, Task] = {}
-        self._task_counter = 1
+        self._by_index: dict[int, Task] = {}
+        self._id_counter: Iterator[int] = itertools.count(1)
+        self._max_index: int = -1
+        self._sorted_cache: list[Task] | None = None
+        self._list_cache: str | None = None
 
     def _get_next_index(self) -> int:
         """
@@ -23,15 +75,28 @@ class TaskService:
         If tasks exist, it returns the maximum current index plus one.
         Otherwise, it returns 0 for the first task.
         """
-        if not self.tasks:
-            return 0
-        return max(task.index for task in self.tasks.values()) + 1
+        return self._max_index + 1
+
+    def _recompute_max_index(self) -> None:
+        """Rescans all tasks to refresh the cached maximum index."""
+        self._max_index = max(self._by_index, default=-1)
+
+    def _reset_indices(self) -> None:
+        """
+        Empties the task collection and every structure derived from it.
+
+        The dicts are cleared in place so references held elsewhere stay valid.
+        The ID counter is left untouched so IDs are never reused.
+        """
+        self.tasks.clear()
+        self._by_index.clear()
+        self._max_index = -1
+        self._sorted_cache = None
+        self._list_cache = None
 
     def _get_next_task_id(self) -> str:
         """Generates a unique, auto-incrementing task ID."""
-        task_id = f"task_{self._task_counter}"
-        self._task_counter += 1
-        return task_id
+        return f"task_{next(self._id_counter)}"
 
     def append_task(self, task: Task) -> None:
         """
@@ -52,13 +117,15 @@ class TaskService:
         # Auto-assign index if not provided
         if task.index is None:
             task.index = self._get_next_index()
-        else:
-            # Check for duplicate index if one was provided
-            for t in self.tasks.values():
-                if t.index == task.index:
-                    raise ValueError(f"Index {task.index} is already in use.")
+        # Check for duplicate index if one was provided
+        elif task.index in self._by_index:
+            raise ValueError(f"Index {task.index} is already in use.")
 
         self.tasks[task.id] = task
+        self._by_index[task.index] = task
+        self._max_index = max(self._max_index, task.index)
+        self._sorted_cache = None
+        self._list_cache = None
 
     def append_tasks(self, tasks: list[Task]) -> None:
         """
@@ -75,44 +142,42 @@ class TaskService:
             ValueError: If any task ID or index conflicts with existing tasks
                         or other tasks in the input list.
         """
-        existing_ids = {task_id for task_id in self.tasks.keys()}
-        existing_indices = {task.index for task in self.tasks.values()}
-
-        incoming_ids = set()
-        incoming_indices = set()
         next_auto_index = self._get_next_index()
-
-        # First pass: validate and assign IDs and indices
-        for i, task in enumerate(tasks):
-            # Auto-assign ID if not provided
+        ids = [task.id for task in tasks if task.id]
+        indices = [next_auto_index + i if task.index is None else task.index for i, task in enumerate(tasks)]
+
+        # Validate the whole batch up front with set operations
+        id_set = set(ids)
+        taken_ids = id_set & self.tasks.keys()
+        if taken_ids:
+            task_id = next(task_id for task_id in ids if task_id in taken_ids)
+            raise ValueError(f"Task with ID {task_id} already exists.")
+        if len(id_set) != len(ids):
+            raise ValueError(f"Duplicate task ID {_first_duplicate(ids)} found in the input list.")
+
+        index_set = set(indices)
+        taken_indices = index_set & self._by_index.keys()
+        if taken_indices:
+            index = next(index for index in indices if index in taken_indices)
+            raise ValueError(f"Index {index} is already in use.")
+        if len(index_set) != len(indices):
+            raise ValueError(f"Duplicate task index {_first_duplicate(indices)} found in the input list.")
+
+        # Assign missing IDs and indices, then add all of em in one go
+        staged: dict[str, Task] = {}
+        staged_indices: dict[int, Task] = {}
+        for task, index in zip(tasks, indices):
             if not task.id:
                 task.id = self._get_next_task_id()
-            else:
-                # Check for duplicate ID in existing tasks
-                if task.id in existing_ids:
-                    raise ValueError(f"Task with ID {task.id} already exists.")
-                # Check for duplicate ID within the incoming batch itself
-                if task.id in incoming_ids:
-                    raise ValueError(f"Duplicate task ID {task.id} found in the input list.")
-
-            # Auto-assign index if not provided
-            if task.index is None:
-                task.index = next_auto_index + i
-            else:
-                # Check for duplicate index in existing tasks
-                if task.index in existing_indices:
-                    raise ValueError(f"Index {task.index} is already in use.")
-                # Check for duplicate index within the incoming batch itself
-                if task.index in incoming_indices:
-                    raise ValueError(f"Duplicate task index {task.index} found in the input list.")
-
-            # Add to sets for future checks within the same batch
-            incoming_ids.add(task.id)
-            incoming_indices.add(task.index)
-
-        # Second pass: add all of em
-        for task in tasks:
-            self.tasks[task.id] = task
+            task.index = index
+            staged[task.id] = task
+            staged_indices[index] = task
+        self.tasks.update(staged)
+        self._by_index.update(staged_indices)
+        if indices:
+            self._max_index = max(self._max_index, max(indices))
+            self._sorted_cache = None
+            self._list_cache = None
 
     def get_task(self, task_id: str) -> Task:
         """
@@ -127,17 +192,26 @@ class TaskService:
         Raises:
             KeyError: If no task with the specified ID is found.
         """
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             raise KeyError(f"Task with ID {task_id} not found.")
-        return self.tasks[task_id]
+        return task
 
     def get_tasks(self) -> list[Task]:
         """
         Retrieves all tasks currently managed by the service.
 
         The tasks are returned sorted by their numerical index in ascending order.
+        The ordering is cached until the next mutation that can change it.
         """
-        return sorted(list(self.tasks.values()), key=lambda t: t.index)
+        if self._sorted_cache is None:
+            by_index = self._by_index
+            self._sorted_cache = [by_index[index] for index in sorted(by_index)]
+        return list(self._sorted_cache)
+
+    def count_tasks(self) -> int:
+        """Returns the number of tasks currently managed by the service."""
+        return len(self.tasks)
 
     def get_tasks_by_ids(self, task_ids: list[str]) -> list[Task]:
         """
@@ -156,10 +230,50 @@ class TaskService:
         """
         tasks = []
         for task_id in task_ids:
-            if task_id not in self.tasks:
+            task = self.tasks.get(task_id)
+            if task is None:
                 raise KeyError(f"Task with ID {task_id} not found.")
-            tasks.append(self.tasks[task_id])
-        return sorted(tasks, key=lambda t: t.index)
+            tasks.append(task)
+        return sorted(tasks, key=_INDEX_KEY)
+
+    def render_task_list(self, task_ids: list[str] | None = None) -> str:
+        """
+        Renders tasks as a readable listing, sorted by their numerical index.
+
+        A single task renders as "Task: <row>"; several render as a "Found N tasks:"
+        header followed by one row per task.
+
+        Args:
+            task_ids: A list of task IDs to render, or None for all tasks.
+
+        Returns:
+            The listing text, or an empty string if there are no tasks to render.
+            The all-tasks listing is cached until the next mutation through the service.
+
+        Raises:
+            KeyError: If any task with a specified ID is not found.
+        """
+        if task_ids is None:
+            if self._list_cache is None:
+                self._list_cache = self._render(self.get_tasks())
+            return self._list_cache
+        return self._render(self.get_tasks_by_ids(task_ids))
+
+    @staticmethod
+    def _render(tasks: list[Task]) -> str:
+        """Formats already-sorted tasks into listing text, or an empty string if there are none."""
+        if not tasks:
+            return ""
+
+        task_lines = (
+            f"[{task.index}] {task.name} (ID: {task.id}, Status: {task.status}, Priority: {task.priority})"
+            for task in tasks
+        )
+
+        task_count = len(tasks)
+        if task_count == 1:
+            return f"Task: {next(task_lines)}"
+        return f"Found {task_count} tasks:\n" + "\n".join(task_lines)
 
     def mark_task_as_done(self, task_id: str) -> None:
         """
@@ -171,11 +285,13 @@ class TaskService:
         Raises:
             KeyError: If no task with the specified ID is found.
         """
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             raise KeyError(f"Task with ID {task_id} not found.")
-        self.tasks[task_id].status = TaskStatus.DONE
+        task.status = TaskStatus.DONE
+        self._list_cache = None
 
-    def mark_multiple_tasks_as_done(self, task_ids: list[str]) -> None:
+    def mark_multiple_tasks_as_done(self, task_ids: list[str]) -> int:
         """
         Marks multiple tasks as done in a batch operation.
 
@@ -184,6 +300,9 @@ class TaskService:
         Args:
             task_ids: A list of task IDs to mark as done.
 
+        Returns:
+            The number of distinct tasks marked as done.
+
         Raises:
             KeyError: If any of the specified task IDs are not found.
         """
@@ -194,14 +313,18 @@ class TaskService:
 
         # If all checks pass, proceed with marking
         for task_id in task_ids:
-            self.mark_task_as_done(task_id=task_id)
+            self.tasks[task_id].status = TaskStatus.DONE
+        self._list_cache = None
+        return len(set(task_ids))
 
     def mark_all_tasks_as_done(self) -> None:
         """Marks all tasks currently in the service as 'DONE'."""
-        for task_id in self.tasks:
-            self.mark_task_as_done(task_id=task_id)
+        done = TaskStatus.DONE
+        for task in self.tasks.values():
+            task.status = done
+        self._list_cache = None
 
-    def update_task(self, task_id: str, **kwargs) -> None:
+    def update_task(self, task_id: str, **kwargs: Any) -> None:
         """
         Updates one or more properties of a specific task.
 
@@ -215,18 +338,72 @@ class TaskService:
         Raises:
             KeyError: If no task with the specified ID is found.
             AttributeError: If an attempt is made to update a property that does not exist on the Task object.
+            ValueError: If the task ID is being updated, a priority string is not a valid TaskPriority
+                        value, or a new index is not an integer or is already in use by another task.
         """
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             raise KeyError(f"Task with ID {task_id} not found.")
-        task = self.tasks[task_id]
-        for key, value in kwargs.items():
-            if hasattr(task, key):
-                # Convert priority string to enum if needed
-                if key == "priority" and isinstance(value, str):
-                    value = TaskPriority.HIGH if value == "high" else TaskPriority.NORMAL
+        updates = _resolve_updates(kwargs)
+
+        # Check for an index conflict before changing anything
+        new_index = updates.get("index", task.index)
+        moving = new_index != task.index
+        if moving and new_index in self._by_index:
+            raise ValueError(f"Index {new_index} is already in use.")
+
+        # Drop cached views before mutating so a failed assignment cannot leave them stale
+        self._list_cache = None
+        if moving:
+            self._sorted_cache = None
+            # Keep the index lookup in sync when moving a task
+            del self._by_index[task.index]
+            self._by_index[new_index] = task
+        for key, value in updates.items():
+            setattr(task, key, value)
+        if moving:
+            self._recompute_max_index()
+
+    def update_tasks(self, task_ids: list[str], **kwargs: Any) -> None:
+        """
+        Updates the same properties on multiple tasks in a batch.
+
+        Ensures all specified tasks exist and all properties are valid before
+        applying any changes.
+
+        Args:
+            task_ids: A list of task IDs to update.
+            **kwargs: Keyword arguments where the key is the property name and the value is the new value.
+
+        Raises:
+            KeyError: If any of the specified task IDs are not found.
+            AttributeError: If an attempt is made to update a property that does not exist on the Task object.
+            ValueError: If the task ID is being updated, a priority string is not a valid
+                        TaskPriority value, or an index is given for more than one task or is already in use.
+        """
+        # Check if all tasks exist and resolve values before updating any
+        tasks = []
+        for task_id in task_ids:
+            task = self.tasks.get(task_id)
+            if task is None:
+                raise KeyError(f"Task with ID {task_id} not found. Cannot perform batch update.")
+            tasks.append(task)
+        updates = _resolve_updates(kwargs)
+
+        if not tasks:
+            return
+
+        if "index" in updates:
+            if len(tasks) > 1:
+                raise ValueError("Index cannot be assigned to more than one task.")
+            self.update_task(tasks[0].id, **updates)
+            return
+
+        # If all checks pass, proceed with updating
+        self._list_cache = None
+        for task in tasks:
+            for key, value in updates.items():
                 setattr(task, key, value)
-            else:
-                raise AttributeError(f"Task object has no attribute '{key}' to update.")
 
     def prioritize_task(self, task_id: str, new_priority: TaskPriority) -> None:
         """
@@ -239,9 +416,11 @@ class TaskService:
         Raises:
             KeyError: If no task with the specified ID is found.
         """
-        if task_id not in self.tasks:
+        task = self.tasks.get(task_id)
+        if task is None:
             raise KeyError(f"Task with ID {task_id} not found.")
-        self.tasks[task_id].priority = new_priority
+        task.priority = new_priority
+        self._list_cache = None
 
     def reorder_tasks(self, task_id: str, new_index: int) -> None:
         """
@@ -259,24 +438,23 @@ class TaskService:
             ValueError: If no task is found at the `new_index`.
         """
         curr_task = self.tasks.get(task_id)
-        if not curr_task:
+        if curr_task is None:
             raise KeyError(f"Task with ID {task_id} not found.")
 
-        target_task = None
-        for task in self.tasks.values():
-            if task.index == new_index:
-                target_task = task
-                break
+        if curr_task.index == new_index:
+            return
 
-        if not target_task:
+        target_task = self._by_index.get(new_index)
+        if target_task is None:
             raise ValueError(f"No task found with target index {new_index}.")
 
-        if curr_task == target_task:
-            return
-
         original_curr_index = curr_task.index
         curr_task.index = target_task.index
         target_task.index = original_curr_index
+        self._by_index[curr_task.index] = curr_task
+        self._by_index[target_task.index] = target_task
+        self._sorted_cache = None
+        self._list_cache = None
 
     def delete_task(self, task_id: str) -> None:
         """
@@ -288,9 +466,15 @@ class TaskService:
         Raises:
             KeyError: If no task with the specified ID is found.
         """
-        if task_id not in self.tasks:
+        task = self.tasks.pop(task_id, None)
+        if task is None:
             raise KeyError(f"Task with ID {task_id} not found.")
-        del self.tasks[task_id]
+        del self._by_index[task.index]
+        self._sorted_cache = None
+        self._list_cache = None
+        # Only a removed maximum can shift the next free index
+        if task.index == self._max_index:
+            self._recompute_max_index()
 
     def delete_tasks(self, task_ids: list[str]) -> None:
         """
@@ -311,24 +495,32 @@ class TaskService:
 
         # If all checks pass, proceed with deletion
         for task_id in task_ids:
-            self.delete_task(task_id=task_id)
+            task = self.tasks.pop(task_id)
+            del self._by_index[task.index]
+        self._sorted_cache = None
+        self._list_cache = None
+        if self._max_index not in self._by_index:
+            self._recompute_max_index()
 
     def delete_all_tasks(self) -> None:
         """Delete all tasks currently managed by the service."""
-        self.tasks.clear()
+        self._reset_indices()
 
 
-_task_service = None
+_task_service: TaskService = TaskService()
 
 
 def get_task_service() -> TaskService:
     """
     Provides a singleton instance of TaskService.
 
-    This function ensures that only one instance of TaskService is created
-    and used throughout the application, promoting consistent task management.
+    The shared instance is created once at import time and used throughout
+    the application, promoting consistent task management.
     """
-    global _task_service
-    if _task_service is None:
-        _task_service = TaskService()
     return _task_service
+
+
+def _reset_for_tests() -> None:
+    """Replaces the shared TaskService with a fresh, empty instance."""
+    global _task_service
+    _task_service = TaskService()
@@ -96,6 +96,30 @@ class TestTaskService:
         with pytest.raises(ValueError, match="Duplicate task ID dup found in the input list"):
             service_instance.append_tasks(tasks)
 
+    def test_append_tasks_existing_id_error(self, service_instance):
+        """Test that a conflicting batch is rejected without adding any task."""
+        service_instance.append_task(Task(id="taken", name="Task 0"))
+        tasks = [
+            Task(name="Task 1"),
+            Task(id="taken", name="Task 2")
+        ]
+
+        with pytest.raises(ValueError, match="Task with ID taken already exists"):
+            service_instance.append_tasks(tasks)
+
+        assert len(service_instance.tasks) == 1
+        assert tasks[0].id is None
+
+    def test_append_tasks_index_collides_with_auto_index(self, service_instance):
+        """Test error when a provided index matches one auto-assigned in the same batch."""
+        tasks = [
+            Task(name="Task 1", index=1),
+            Task(name="Task 2")
+        ]
+
+        with pytest.raises(ValueError, match="Duplicate task index 1 found in the input list"):
+            service_instance.append_tasks(tasks)
+
     def test_get_task(self, service_instance):
         """Test retrieving a specific task."""
         task = Task(id="test", name="Test task")
@@ -125,6 +149,37 @@ class TestTaskService:
         assert [t.name for t in tasks] == ["Task A", "Task B", "Task C"]
         assert [t.index for t in tasks] == [0, 1, 2]
 
+    def test_get_tasks_reflects_mutations(self, service_instance):
+        """Test that cached ordering is refreshed after reorder and delete."""
+        task1 = Task(id="a", name="Task A")
+        task2 = Task(id="b", name="Task B")
+        task3 = Task(id="c", name="Task C")
+        service_instance.append_tasks([task1, task2, task3])
+        assert [t.id for t in service_instance.get_tasks()] == ["a", "b", "c"]
+
+        service_instance.reorder_tasks("a", 2)
+        assert [t.id for t in service_instance.get_tasks()] == ["c", "b", "a"]
+
+        service_instance.delete_task("b")
+        assert [t.id for t in service_instance.get_tasks()] == ["c", "a"]
+
+    def test_get_tasks_returns_independent_list(self, service_instance):
+        """Test that mutating the returned list does not affect the service."""
+        service_instance.append_task(Task(name="Task A"))
+
+        tasks = service_instance.get_tasks()
+        tasks.clear()
+
+        assert len(service_instance.get_tasks()) == 1
+
+    def test_count_tasks(self, service_instance):
+        """Test counting tasks."""
+        assert service_instance.count_tasks() == 0
+
+        service_instance.append_tasks([Task(name="Task A"), Task(name="Task B")])
+
+        assert service_instance.count_tasks() == 2
+
     def test_get_tasks_by_ids(self, service_instance):
         """Test getting specific tasks by IDs."""
         task1 = Task(id="a", name="Task A")
@@ -144,6 +199,54 @@ class TestTaskService:
         with pytest.raises(KeyError, match="Task with ID missing not found"):
             service_instance.get_tasks_by_ids(["missing"])
 
+    def test_render_task_list(self, service_instance):
+        """Test rendering all tasks and a single task."""
+        task1 = Task(id="a", name="Task A", priority=TaskPriority.HIGH)
+        task2 = Task(id="b", name="Task B")
+        service_instance.append_tasks([task1, task2])
+
+        assert service_instance.render_task_list() == (
+            "Found 2 tasks:\n"
+            "[0] Task A (ID: a, Status: todo, Priority: high)\n"
+            "[1] Task B (ID: b, Status: todo, Priority: normal)"
+        )
+        assert service_instance.render_task_list(["b"]) == "Task: [1] Task B (ID: b, Status: todo, Priority: normal)"
+
+    def test_render_task_list_reflects_mutations(self, service_instance):
+        """Test that the cached listing is refreshed after updates."""
+        service_instance.append_task(Task(id="a", name="Task A"))
+        assert "Status: todo" in service_instance.render_task_list()
+
+        service_instance.mark_task_as_done("a")
+        assert "Status: done" in service_instance.render_task_list()
+
+        service_instance.update_task("a", name="Renamed")
+        assert "Renamed" in service_instance.render_task_list()
+
+        service_instance.prioritize_task("a", TaskPriority.HIGH)
+        assert "Priority: high" in service_instance.render_task_list()
+
+        service_instance.delete_all_tasks()
+        assert service_instance.render_task_list() == ""
+
+    def test_render_task_list_after_failed_update(self, service_instance):
+        """Test that a rejected update leaves the cached listing consistent with the tasks."""
+        service_instance.append_tasks([Task(id="a", name="Task A"), Task(id="b", name="Task B")])
+        service_instance.render_task_list()
+
+        with pytest.raises(ValueError, match="Index 1 is already in use"):
+            service_instance.update_task("a", name="Renamed", index=1)
+
+        assert service_instance.render_task_list() == (
+            "Found 2 tasks:\n"
+            "[0] Task A (ID: a, Status: todo, Priority: normal)\n"
+            "[1] Task B (ID: b, Status: todo, Priority: normal)"
+        )
+
+    def test_render_task_list_empty(self, service_instance):
+        """Test rendering when there are no tasks."""
+        assert service_instance.render_task_list() == ""
+
     def test_mark_task_as_done(self, service_instance):
         """Test marking a task as done."""
         task = Task(id="test", name="Test task")
@@ -171,6 +274,17 @@ class TestTaskService:
         assert service_instance.get_task("a").status == TaskStatus.DONE
         assert service_instance.get_task("b").status == TaskStatus.DONE
 
+    def test_mark_multiple_tasks_as_done_repeated_ids(self, service_instance):
+        """Test that repeated IDs are counted once."""
+        task1 = Task(id="a", name="Task A")
+        task2 = Task(id="b", name="Task B")
+        service_instance.append_tasks([task1, task2])
+
+        marked = service_instance.mark_multiple_tasks_as_done(["a", "b", "a"])
+
+        assert marked == 2
+        assert service_instance.get_task("a").status == TaskStatus.DONE
+
     def test_mark_multiple_tasks_as_done_partial_error(self, service_instance):
         """Test error when some tasks in batch don't exist."""
         task1 = Task(id="a", name="Task A")
@@ -217,6 +331,120 @@ class TestTaskService:
         with pytest.raises(AttributeError, match="no attribute 'invalid'"):
             service_instance.update_task("test", invalid="value")
 
+    def test_enums_behave_as_strings(self):
+        """Test that status and priority members act as their string values."""
+        assert TaskPriority.HIGH == "high"
+        assert str(TaskStatus.DONE) == "done"
+        assert f"{TaskPriority.NORMAL}" == "normal"
+
+    def test_update_task_invalid_priority(self, service_instance):
+        """Test error when updating priority with an unknown value."""
+        task = Task(id="test", name="Test task")
+        service_instance.append_task(task)
+
+        with pytest.raises(ValueError, match="Invalid priority 'urgent'"):
+            service_instance.update_task("test", priority="urgent")
+
+        assert service_instance.get_task("test").priority == TaskPriority.NORMAL
+
+    def test_update_tasks_batch(self, service_instance):
+        """Test updating the same properties on multiple tasks."""
+        task1 = Task(id="a", name="Task A")
+        task2 = Task(id="b", name="Task B")
+        service_instance.append_tasks([task1, task2])
+
+        service_instance.update_tasks(["a", "b"], priority="high")
+
+        assert service_instance.get_task("a").priority == TaskPriority.HIGH
+        assert service_instance.get_task("b").priority == TaskPriority.HIGH
+
+    def test_update_tasks_partial_error(self, service_instance):
+        """Test error when some tasks in batch don't exist."""
+        task1 = Task(id="a", name="Task A")
+        service_instance.append_task(task1)
+
+        with pytest.raises(KeyError, match="Task with ID missing not found"):
+            service_instance.update_tasks(["a", "missing"], name="Renamed")
+
+        assert service_instance.get_task("a").name == "Task A"
+
+    def test_update_tasks_index_for_multiple_tasks_error(self, service_instance):
+        """Test error when assigning one index to several tasks."""
+        task1 = Task(id="a", name="Task A")
+        task2 = Task(id="b", name="Task B")
+        service_instance.append_tasks([task1, task2])
+
+        with pytest.raises(ValueError, match="Index cannot be assigned to more than one task"):
+            service_instance.update_tasks(["a", "b"], index=5)
+
+    def test_update_tasks_id_error(self, service_instance):
+        """Test that task IDs cannot be overwritten through a batch update."""
+        task1 = Task(id="a", name="Task A")
+        task2 = Task(id="b", name="Task B")
+        service_instance.append_tasks([task1, task2])
+
+        with pytest.raises(ValueError, match="Task ID cannot be updated"):
+            service_instance.update_tasks(["a", "b"], id="x")
+
+        assert [t.id for t in service_instance.get_tasks()] == ["a", "b"]
+        assert set(service_instance.tasks) == {"a", "b"}
+
+    def test_update_tasks_empty_ids_with_index(self, service_instance):
+        """Test that an index update with no task IDs changes nothing."""
+        service_instance.append_task(Task(id="a", name="Task A"))
+
+        service_instance.update_tasks([], index=3)
+
+        assert service_instance.get_task("a").index == 0
+
+    def test_update_task_index(self, service_instance):
+        """Test moving a task to a free index keeps it reachable by reorder."""
+        task1 = Task(id="a", name="Task A", index=0)
+        task2 = Task(id="b", name="Task B", index=1)
+        service_instance.append_tasks([task1, task2])
+
+        service_instance.update_task("a", index=5)
+        service_instance.reorder_tasks("b", 5)
+
+        assert service_instance.get_task("a").index == 1
+        assert service_instance.get_task("b").index == 5
+
+    def test_update_task_index_in_use_error(self, service_instance):
+        """Test error when updating a task to an index that is taken."""
+        task1 = Task(id="a", name="Task A", index=0)
+        task2 = Task(id="b", name="Task B", index=1)
+        service_instance.append_tasks([task1, task2])
+
+        with pytest.raises(ValueError, match="Index 1 is already in use"):
+            service_instance.update_task("a", index=1)
+
+    def test_update_task_index_in_use_leaves_task_unchanged(self, service_instance):
+        """Test that a rejected index update applies none of the other properties."""
+        task1 = Task(id="a", name="Task A", index=0)
+        task2 = Task(id="b", name="Task B", index=1)
+        service_instance.append_tasks([task1, task2])
+
+        with pytest.raises(ValueError, match="Index 1 is already in use"):
+            service_instance.update_task("a", name="Renamed", index=1)
+
+        assert service_instance.get_task("a").name == "Task A"
+        assert service_instance.get_task("a").index == 0
+
+    def test_update_task_non_int_index_leaves_service_unchanged(self, service_instance):
+        """Test that a non-integer index is rejected before anything is changed."""
+        task1 = Task(id="a", name="Task A", index=0)
+        task2 = Task(id="b", name="Task B", index=1)
+        service_instance.append_tasks([task1, task2])
+
+        for bad_index in ("7", None, True):
+            with pytest.raises(ValueError, match="Index must be an integer"):
+                service_instance.update_task("a", name="Renamed", index=bad_index)
+
+        assert service_instance._by_index == {0: task1, 1: task2}
+        assert service_instance.get_task("a").name == "Task A"
+        assert service_instance.get_task("a").index == 0
+        assert [t.id for t in service_instance.get_tasks()] == ["a", "b"]
+
     def test_prioritize_task(self, service_instance):
         """Test setting task priority."""
         task = Task(id="test", name="Test task")
@@ -320,6 +548,17 @@ class TestTaskService:
         assert len(service_instance.tasks) == 0
         assert service_instance.get_tasks() == []
 
+    def test_delete_all_tasks_keeps_id_counter(self, service_instance):
+        """Test that IDs are not reused after deleting all tasks."""
+        service_instance.append_task(Task(name="Task 1"))
+        service_instance.delete_all_tasks()
+
+        task = Task(name="Task 2")
+        service_instance.append_task(task)
+
+        assert task.id == "task_2"
+        assert task.index == 0
+
     def test_id_auto_increment(self, service_instance):
         """Test that auto-assigned IDs increment properly."""
         task1 = Task(name="Task 1")
@@ -348,6 +587,18 @@ class TestTaskService:
         assert task2.index == 1
         assert task3.index == 2
 
+    def test_index_after_deleting_last_task(self, service_instance):
+        """Test that deleting the highest-indexed task frees its index."""
+        task1 = Task(id="a", name="Task A")
+        task2 = Task(id="b", name="Task B")
+        service_instance.append_tasks([task1, task2])
+
+        service_instance.delete_task("b")
+        task3 = Task(name="Task C")
+        service_instance.append_task(task3)
+
+        assert task3.index == 1
+
     def test_mixed_auto_and_manual_ids(self, service_instance):
         """Test mixing auto-assigned and manual IDs."""
         task1 = Task(name="Task 1")
@@ -406,3 +657,14 @@ class TestGetTaskService:
 
         assert retrieved.name == "Test task"
         assert len(service2.tasks) == 1
+
+    def test_reset_for_tests(self):
+        """Test that resetting yields a fresh, empty instance."""
+        from task.service import _reset_for_tests, get_task_service
+
+        service1 = get_task_service()
+        _reset_for_tests()
+        service2 = get_task_service()
+
+        assert service1 is not service2
+        assert len(service2.tasks) == 0
@@ -0,0 +1,214 @@
+import pytest
+
+from task import TaskPriority, TaskStatus, TaskTool
+from task.service import _reset_for_tests, get_task_service
+
+
+@pytest.fixture
+def tool_instance():
+    """Provides a TaskTool backed by a fresh shared TaskService for each test."""
+    _reset_for_tests()
+    return TaskTool()
+
+
+class TestTaskTool:
+    """Test TaskTool operations."""
+
+    def test_parameters_shared_between_instances(self):
+        """Test that the schema is built once and shared."""
+        assert TaskTool().parameters is TaskTool().parameters
+        assert TaskTool().parameters["required"] == ["action"]
+
+    def test_update_properties(self, tool_instance):
+        """Test updating properties on multiple tasks."""
+        tool_instance.execute({"action": "add", "tasks": [{"name": "Task A"}, {"name": "Task B"}]})
+
+        result = tool_instance.execute({
+            "action": "update",
+            "update_type": "update_properties",
+            "task_ids": ["task_1", "task_2"],
+            "properties": {"priority": "high"}
+        })
+
+        assert not result.isError
+        assert result.content[0].text == "Successfully updated 2 tasks (priority)."
+        assert get_task_service().get_task("task_1").priority == TaskPriority.HIGH
+        assert get_task_service().get_task("task_2").priority == TaskPriority.HIGH
+
+    def test_update_properties_missing_task(self, tool_instance):
+        """Test that a missing ID rejects the whole update."""
+        tool_instance.execute({"action": "add", "tasks": [{"name": "Task A"}]})
+
+        result = tool_instance.execute({
+            "action": "update",
+            "update_type": "update_properties",
+            "task_ids": ["task_1", "missing"],
+            "properties": {"name": "Renamed"}
+        })
+
+        assert result.isError
+        assert "Task with ID missing not found" in result.content[0].text
+        assert get_task_service().get_task("task_1").name == "Task A"
+
+    def test_update_properties_non_int_index(self, tool_instance):
+        """Test that a non-integer index is reported and leaves tasks listable."""
+        tool_instance.execute({"action": "add", "tasks": [{"name": "Task A"}]})
+
+        result = tool_instance.execute({
+            "action": "update",
+            "update_type": "update_properties",
+            "task_ids": ["task_1"],
+            "properties": {"index": "7"}
+        })
+
+        assert result.isError
+        assert "Index must be an integer" in result.content[0].text
+        assert not tool_instance.execute({"action": "get"}).isError
+
+    def test_invalid_action(self, tool_instance):
+        """Test error for an unknown action."""
+        result = tool_instance.execute({"action": "archive"})
+
+        assert result.isError
+        assert result.content[0].text == "Invalid action. Must be 'add', 'get', 'update', or 'delete'."
+
+    def test_invalid_update_type(self, tool_instance):
+        """Test error for an unknown update_type."""
+        result = tool_instance.execute({"action": "update", "update_type": "archive"})
+
+        assert result.isError
+        assert result.content[0].text.startswith("Invalid update_type.")
+
+    def test_unhashable_update_type(self, tool_instance):
+        """Test that a non-string update_type is rejected as invalid."""
+        result = tool_instance.execute({"action": "update", "update_type": ["mark_done"]})
+
+        assert result.isError
+        assert result.content[0].text.startswith("Invalid update_type.")
+
+    def test_mark_done(self, tool_instance):
+        """Test marking selected tasks as done."""
+        tool_instance.execute({"action": "add", "tasks": [{"name": "Task A"}, {"name": "Task B"}]})
+
+        result = tool_instance.execute({"action": "update", "update_type": "mark_done", "task_ids": ["task_2"]})
+
+        assert result.content[0].text == "Successfully marked 1 task as done."
+        assert get_task_service().get_task("task_1").status == TaskStatus.TODO
+        assert get_task_service().get_task("task_2").status == TaskStatus.DONE
+
+    def test_mark_done_with_repeated_ids(self, tool_instance):
+        """Test that repeated IDs are marked and counted once."""
+        tool_instance.execute({"action": "add", "tasks": [{"name": "Task A"}, {"name": "Task B"}]})
+
+        result = tool_instance.execute({"action": "update", "update_type": "mark_done", "task_ids": ["task_1", "task_1"]})
+
+        assert result.content[0].text == "Successfully marked 1 task as done."
+
+    def test_reorder(self, tool_instance):
+        """Test reordering a task through the tool."""
+        tool_instance.execute({"action": "add", "tasks": [{"name": "Task A"}, {"name": "Task B"}]})
+
+        result = tool_instance.execute({
+            "action": "update",
+            "update_type": "reorder",
+            "task_ids": ["task_1"],
+            "new_index": 1
+        })
+
+        assert result.content[0].text == "Successfully reordered task to index 1."
+        assert get_task_service().get_task("task_1").index == 1
+
+    def test_get_all(self, tool_instance):
+        """Test listing all tasks."""
+        tool_instance.execute({"action": "add", "tasks": [{"name": "Task A", "priority": "high"}, {"name": "Task B"}]})
+
+        result = tool_instance.execute({"action": "get"})
+
+        assert result.content[0].text == (
+            "Found 2 tasks:\n"
+            "[0] Task A (ID: task_1, Status: todo, Priority: high)\n"
+            "[1] Task B (ID: task_2, Status: todo, Priority: normal)"
+        )
+
+    def test_get_single(self, tool_instance):
+        """Test getting a single task by ID."""
+        tool_instance.execute({"action": "add", "tasks": [{"name": "Task A"}, {"name": "Task B"}]})
+
+        result = tool_instance.execute({"action": "get", "task_ids": ["task_2"]})
+
+        assert result.content[0].text == "Task: [1] Task B (ID: task_2, Status: todo, Priority: normal)"
+
+    def test_get_empty(self, tool_instance):
+        """Test listing when there are no tasks."""
+        result = tool_instance.execute({"action": "get"})
+
+        assert not result.isError
+        assert result.content[0].text == "No tasks found."
+
+    def test_add_single(self, tool_instance):
+        """Test adding a single task with an explicit index."""
+        result = tool_instance.execute({"action": "add", "tasks": [{"name": "Task A", "index": 3, "priority": "high"}]})
+
+        assert result.content[0].text == "Successfully added 1 task."
+        task = get_task_service().get_task("task_1")
+        assert task.index == 3
+        assert task.priority == TaskPriority.HIGH
+
+    def test_add_unhashable_priority_defaults_to_normal(self, tool_instance):
+        """Test that a non-string priority falls back to normal."""
+        result = tool_instance.execute({"action": "add", "tasks": [{"name": "Task A", "priority": ["high"]}]})
+
+        assert not result.isError
+        assert get_task_service().get_task("task_1").priority == TaskPriority.NORMAL
+
+    def test_delete_with_repeated_ids(self, tool_instance):
+        """Test that repeated IDs are deleted and counted once."""
+        tool_instance.execute({"action": "add", "tasks": [{"name": "Task A"}, {"name": "Task B"}]})
+
+        result = tool_instance.execute({"action": "delete", "task_ids": ["task_1", "task_1"]})
+
+        assert not result.isError
+        assert result.content[0].text == "Successfully deleted 1 task."
+        assert get_task_service().count_tasks() == 1
+
+    def test_reorder_without_tasks(self, tool_instance):
+        """Test that reordering an empty task list fails early."""
+        result = tool_instance.execute({
+            "action": "update",
+            "update_type": "reorder",
+            "task_ids": ["task_1"],
+            "new_index": 0
+        })
+
+        assert result.isError
+        assert result.content[0].text == "No tasks to reorder."
+
+    def test_service_error_becomes_error_result(self, tool_instance):
+        """Test that service exceptions are reported as error results."""
+        result = tool_instance.execute({"action": "get", "task_ids": ["missing"]})
+
+        assert result.isError
+        assert result.content[0].text.startswith("Error:")
+        assert "Task with ID missing not found" in result.content[0].text
+
+    def test_unhashable_action(self, tool_instance):
+        """Test that a non-string action is rejected as invalid."""
+        result = tool_instance.execute({"action": ["add"]})
+
+        assert result.isError
+        assert result.content[0].text.startswith("Invalid action.")
+
+    def test_non_dict_params(self, tool_instance):
+        """Test that a non-dict payload is reported as an error instead of raising."""
+        result = tool_instance.execute(None)
+
+        assert result.isError
+        assert result.content[0].text.startswith("Invalid action.")
+
+    def test_add_missing_name(self, tool_instance):
+        """Test that tasks without a name are reported by position and nothing is added."""
+        result = tool_instance.execute({"action": "add", "tasks": [{"name": "Task A"}, {"priority": "high"}]})
+
+        assert result.isError
+        assert result.content[0].text == "Task name is required (missing for tasks at positions 1)."
+        assert get_task_service().count_tasks() == 0
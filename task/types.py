@@ -1,19 +1,28 @@
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
-class TaskPriority(Enum):
-    """Task priority values."""
+class TaskPriority(str, Enum):
+    """Task priority values. Members compare equal to and format as their string value."""
     HIGH = "high"
     NORMAL = "normal"
 
+    __str__ = str.__str__
+    __format__ = str.__format__
 
-class TaskStatus(Enum):
-    """Task status values."""
+
+PRIORITY_BY_VALUE: dict[str, TaskPriority] = {p.value: p for p in TaskPriority}
+
+
+class TaskStatus(str, Enum):
+    """Task status values. Members compare equal to and format as their string value."""
     TODO = "todo"
     DONE = "done"
 
+    __str__ = str.__str__
+    __format__ = str.__format__
+
 
 class Task(BaseModel):
     """
@@ -32,6 +41,9 @@ class Task(BaseModel):
         priority (TaskPriority): The urgency level of the task.
                                  Defaults to TaskPriority.NORMAL.
     """
+    # Assignment is left unvalidated so the service's bulk status/index updates stay cheap
+    model_config = ConfigDict(validate_assignment=False)
+
     id: str | None = None
     name: str
     index: int | None = None